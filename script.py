@@ -23,6 +23,7 @@ Features now included
 Dependencies
 ────────────
     pip install jdatetime emoji
+    pip install pyahocorasick   # optional, faster bad‑word matching
 
 Run
 ───
@@ -31,9 +32,13 @@ Run
 
 from __future__ import annotations
 
-from collections import defaultdict, Counter
+from collections import Counter
 from pathlib import Path
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from operator import itemgetter
+import heapq
+import os
 import re
 import sys
 
@@ -42,17 +47,25 @@ try:
     import jdatetime  # Jalali conversion
 except ImportError:
     jdatetime = None
-    print("⚠️  jdatetime not installed – output will stay Gregorian.")
+    if __name__ == "__main__":  # not again in spawned pool workers
+        print("⚠️  jdatetime not installed – output will stay Gregorian.")
 
 try:
     import emoji  # for robust emoji detection
 except ImportError:
     emoji = None
-    print("⚠️  emoji library not installed – emoji counts may be incomplete.")
+    if __name__ == "__main__":  # not again in spawned pool workers
+        print("⚠️  emoji library not installed – emoji counts may be incomplete.")
+
+try:
+    import ahocorasick  # optional, C automaton for bad‑word matching
+except ImportError:
+    ahocorasick = None
 
 CHAT_FILE = Path("Chats_update_2025-07-06.txt")
 BAD_WORDS_FILE = Path("bad_words.txt")
 STOP_WORDS_FILE = Path("stop_words.txt")  # optional, Persian/English stop words
+PARALLEL_MIN_BYTES = 16 << 20  # smaller exports are faster without process start-up
 
 # ---------- Load inputs ------------------------------------------------------
 if not CHAT_FILE.exists():
@@ -66,28 +79,72 @@ stop_words: set[str] = set()
 if STOP_WORDS_FILE.exists():
     stop_words = {w.strip().lower() for w in STOP_WORDS_FILE.read_text(encoding="utf-8").splitlines() if w.strip()}
 
-lines = CHAT_FILE.read_text(encoding="utf-8").splitlines()
+# One alternation scans a message once instead of once per bad word (longest first)
+BAD_WORD_RE = re.compile("|".join(sorted(map(re.escape, bad_words), key=len, reverse=True))) if bad_words else None
+
+# Aho‑Corasick stays linear in the message length however long the list gets
+BAD_WORD_AUTOMATON = None
+if bad_words and ahocorasick:
+    BAD_WORD_AUTOMATON = ahocorasick.Automaton()
+    for bw in bad_words:
+        BAD_WORD_AUTOMATON.add_word(bw, bw)
+    BAD_WORD_AUTOMATON.make_automaton()
+
+def has_bad_word(message: str) -> bool:
+    if BAD_WORD_AUTOMATON is not None:
+        return next(BAD_WORD_AUTOMATON.iter(message), None) is not None
+    return BAD_WORD_RE is not None and BAD_WORD_RE.search(message) is not None
+
+def iter_lines(path: Path, start: int = 0, end: int | None = None):
+    """Stream raw byte lines that start in [start, end) through a 1 MiB buffer."""
+    with open(path, "rb", buffering=1 << 20) as f:
+        f.seek(start)
+        if end is None:
+            yield from f
+            return
+        pos = start
+        for line in f:
+            if pos >= end:
+                break
+            pos += len(line)
+            yield line
+
+def chunk_offsets(path: Path, n: int) -> list[tuple[int, int]]:
+    """Split *path* into up to n byte ranges, each starting at the beginning of a line."""
+    size = path.stat().st_size
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, n):
+            f.seek(size * i // n)
+            f.readline()  # the line we landed in belongs to the previous range
+            bounds.append(max(f.tell(), bounds[-1]))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
 
 # ---------- Data structures --------------------------------------------------
-user_stats = defaultdict(lambda: {
-    "messages": 0,
-    "media": 0,
-    "deleted": 0,
-    "bad_word": 0,
-    "char_sum": 0,
-    "word_sum": 0,
-    "first_ts": None,
-    "last_ts": None,
-})
-
-hour_counts = Counter()     # 0‑23
-weekday_counts = Counter()  # 0‑6 (Sat=0)
-month_counts = Counter()    # 1‑12 (Jalali or Gregorian)
-
-word_freq_global = Counter()
-emoji_freq_global = Counter()
-media_per_day = Counter()
-messages_per_day = defaultdict(int)
+class UserStats:
+    """Per-user counters; slotted so field access is an array index, not a dict lookup."""
+    __slots__ = ("messages", "media", "deleted", "bad_word", "char_sum", "word_sum", "first_ts", "last_ts")
+
+    def __init__(self, first_ts: datetime):
+        self.messages = 0
+        self.media = 0
+        self.deleted = 0
+        self.bad_word = 0
+        self.char_sum = 0
+        self.word_sum = 0
+        self.first_ts = first_ts
+        self.last_ts = first_ts
+
+    def merge(self, later: UserStats) -> None:
+        """Fold in the stats of the same user from a later chunk of the chat."""
+        self.messages += later.messages
+        self.media += later.media
+        self.deleted += later.deleted
+        self.bad_word += later.bad_word
+        self.char_sum += later.char_sum
+        self.word_sum += later.word_sum
+        self.last_ts = later.last_ts
 
 # Persian weekday names (Saturday index 0 matching jdatetime)
 FA_WEEKDAYS = [
@@ -100,176 +157,373 @@ DELETED_TAG = "This message was deleted"
 RE_CREATED = re.compile(r'(.+?) created (?:group|this group) "?(.*?)"?$', re.I)
 RE_GROUP_RENAME = re.compile(r'^(.*?) - (.+?) changed the group name from "(.+?)" to "(.+?)"', re.I)
 
-# Simple emoji detector fallback if emoji lib missing
-EMOJI_PATTERN = re.compile(r'[\U0001F300-\U0001FAFF]')
+# Word tokens: runs of letters/digits (punctuation and underscores split words)
+TOKEN_RE = re.compile(r"[^\W_]+")
 
+# Simple emoji detector fallback if emoji lib missing
+# Approximates the Unicode emoji set: flags are matched as regional‑indicator
+# pairs, then single codepoints; only the emoji ones from the symbol blocks.
+EMOJI_PATTERN = re.compile(
+    r'[\U0001F1E6-\U0001F1FF]{2}'      # flags (🇮🇷)
+    r'|[\U0001F300-\U0001FAFF'          # pictographs, emoticons, transport, ...
+    r'\U0001F004\U0001F0CF\U0001F170\U0001F171\U0001F17E\U0001F17F\U0001F18E\U0001F191-\U0001F19A'
+    r'\U0001F201\U0001F202\U0001F21A\U0001F22F\U0001F232-\U0001F23A\U0001F250\U0001F251'
+    # misc symbols & dingbats (☀ ☎ ✅ ❤ ...), without plain glyphs like ★ or ✓
+    r'\u2600-\u2604\u260E\u2611\u2614\u2615\u2618\u261D\u2620\u2622\u2623\u2626\u262A\u262E\u262F'
+    r'\u2638-\u263A\u2640\u2642\u2648-\u2653\u265F\u2660\u2663\u2665\u2666\u2668\u267B\u267E\u267F'
+    r'\u2692-\u2697\u2699\u269B\u269C\u26A0\u26A1\u26A7\u26AA\u26AB\u26B0\u26B1\u26BD\u26BE\u26C4\u26C5'
+    r'\u26C8\u26CE\u26CF\u26D1\u26D3\u26D4\u26E9\u26EA\u26F0-\u26F5\u26F7-\u26FA\u26FD'
+    r'\u2702\u2705\u2708-\u270D\u270F\u2712\u2714\u2716\u271D\u2721\u2728\u2733\u2734\u2744\u2747'
+    r'\u274C\u274E\u2753-\u2755\u2757\u2763\u2764\u2795-\u2797\u27A1\u27B0\u27BF'
+    r'\u231A\u231B\u23E9-\u23F3\u23F8-\u23FA'
+    r'\u2B05-\u2B07\u2B1B\u2B1C\u2B50\u2B55\u3030\u303D\u3297\u3299]'
+)
+# With the emoji lib, flag pairs then one character class over every single-codepoint emoji
+EMOJI_RE = (
+    re.compile(
+        r"[\U0001F1E6-\U0001F1FF]{2}|["
+        + "".join(re.escape(ch) for ch in emoji.EMOJI_DATA if len(ch) == 1) + "]"
+    )
+    if emoji else EMOJI_PATTERN
+)
+
+# Common WhatsApp timestamp formats
+TS_FORMATS = [
+    "%m/%d/%y, %I:%M %p",  # 12h, e.g. 11/4/20, 9:53 AM
+    "%d/%m/%y, %I:%M %p",  # 12h, e.g. 4/11/20, 9:53 AM
+    "%m/%d/%y, %H:%M",     # 24h, e.g. 11/4/20, 21:53
+    "%d/%m/%y, %H:%M",     # 24h, e.g. 4/11/20, 21:53
+]
 
-group_info: dict[str, str | None] = {"created_ts": None, "created_by": None, "created_name": None}
-group_renames: list[tuple[str, str, str, str]] = []  # (date, changer, old, new)
+def _split_stamp(ts: str) -> tuple[int, int, int, int, int, str]:
+    """Split 'A/B/YY, H:MM[ AM]' into (A, B, year, hour, minute, suffix); ValueError if malformed."""
+    a, b, rest = ts.split("/", 2)
+    yy, clock = rest.split(", ", 1)
+    hh, rest = clock.split(":", 1)
+    mm, _, suffix = rest.partition(" ")
+    # Plain 1‑2 digit fields only, like strptime; int() alone would take "1_2", " 1" or huge values
+    for field in (a, b, yy, hh, mm):
+        if not (1 <= len(field) <= 2 and field.isascii() and field.isdigit()):
+            raise ValueError(ts)
+    if len(yy) != 2:
+        raise ValueError(ts)
+    year = int(yy)
+    year += 2000 if year < 69 else 1900  # same pivot as %y
+    return int(a), int(b), year, int(hh), int(mm), suffix.upper()
+
+def _make_fast_parser(day_first: bool, twelve_hour: bool):
+    """Build a strptime‑free parser specialised for one of TS_FORMATS."""
+    def parse(ts: str) -> datetime:
+        a, b, year, hour, minute, suffix = _split_stamp(ts)
+        month, day = (b, a) if day_first else (a, b)
+        if twelve_hour:
+            if suffix not in ("AM", "PM") or not 1 <= hour <= 12:
+                raise ValueError(ts)
+            hour = hour % 12 + (12 if suffix == "PM" else 0)
+        elif suffix:
+            raise ValueError(ts)
+        return datetime(year, month, day, hour, minute)
+    return parse
+
+_FAST_PARSERS = {
+    TS_FORMATS[0]: _make_fast_parser(day_first=False, twelve_hour=True),
+    TS_FORMATS[1]: _make_fast_parser(day_first=True, twelve_hour=True),
+    TS_FORMATS[2]: _make_fast_parser(day_first=False, twelve_hour=False),
+    TS_FORMATS[3]: _make_fast_parser(day_first=True, twelve_hour=False),
+}
+
+# Exports repeat the same minute stamp many times, so parse each one only once
+_ts_cache: dict[str, datetime | None] = {}
+_detected_fmt: str | None = None
+_fast_parser = None  # specialised parser for _detected_fmt
+_jalali_cache: dict[date, tuple[str, int, int]] = {}
 
 def parse_timestamp(raw_ts: str) -> datetime | None:
     """Return datetime from WhatsApp export timestamp (handles 12/24h, M/D/YY and D/M/YY)."""
-    # Try common WhatsApp formats
-    formats = [
-        "%m/%d/%y, %I:%M %p",  # 12h, e.g. 11/4/20, 9:53 AM
-        "%d/%m/%y, %I:%M %p",  # 12h, e.g. 4/11/20, 9:53 AM
-        "%m/%d/%y, %H:%M",     # 24h, e.g. 11/4/20, 21:53
-        "%d/%m/%y, %H:%M",     # 24h, e.g. 4/11/20, 21:53
-    ]
-    for fmt in formats:
+    global _detected_fmt, _fast_parser
+    try:
+        return _ts_cache[raw_ts]
+    except KeyError:
+        pass
+    ts = raw_ts.strip()
+    # Continuation lines that happen to contain " - " are not worth a strptime round
+    if not ts[:1].isdigit() or len(ts) > 20:
+        return None
+    dt = None
+    if _fast_parser is not None:
         try:
-            return datetime.strptime(raw_ts.strip(), fmt)
-        except ValueError:
-            continue
-    return None
-
-def g2j(dt: datetime) -> jdatetime.date | None:
+            dt = _fast_parser(ts)
+        except (ValueError, OverflowError):
+            pass
+    if dt is None:
+        for fmt in TS_FORMATS:
+            try:
+                dt = datetime.strptime(ts, fmt)
+            except ValueError:
+                continue
+            if _detected_fmt is None:
+                _detected_fmt = fmt
+                _fast_parser = _FAST_PARSERS[fmt]
+            break
+    _ts_cache[raw_ts] = dt  # failures too, so a bad stamp is only tried once
+    return dt
+
+def g2j(day: date) -> jdatetime.date | None:
     if jdatetime is None:
         return None
-    return jdatetime.date.fromgregorian(date=dt.date())
+    return jdatetime.date.fromgregorian(date=day)
 
-def format_jalali_date(dt: datetime) -> tuple[str, int, int]:
-    """Return formatted Jalali date string, weekday_index (0‑6), month (1‑12)."""
+def jalali_day(day: date) -> tuple[str, int, int]:
+    """Return formatted Jalali date string, weekday_index (0‑6), month (1‑12); memoized per day."""
+    cached = _jalali_cache.get(day)
+    if cached is not None:
+        return cached
     if jdatetime is None:
-        weekday_idx = dt.weekday()  # Monday=0
+        weekday_idx = day.weekday()  # Monday=0
         # Convert to Saturday=0 mapping to align Persian names
         weekday_idx = (weekday_idx + 2) % 7
-        return dt.strftime("%Y/%m/%d"), weekday_idx, dt.month
-    jd = g2j(dt)
-    weekday_idx = jd.weekday()  # Saturday=0
-    return jd.strftime("%Y/%m/%d"), weekday_idx, jd.month
+        result = day.strftime("%Y/%m/%d"), weekday_idx, day.month
+    else:
+        jd = g2j(day)
+        weekday_idx = jd.weekday()  # Saturday=0
+        result = jd.strftime("%Y/%m/%d"), weekday_idx, jd.month
+    _jalali_cache[day] = result
+    return result
+
+def format_jalali_date(dt: datetime) -> tuple[str, int, int]:
+    """Return formatted Jalali date string, weekday_index (0‑6), month (1‑12)."""
+    return jalali_day(dt.date())
 
 # ---------- Main loop --------------------------------------------------------
-for raw in lines:
-    if " - " not in raw:
-        continue
+def process_chunk(start: int = 0, end: int | None = None) -> tuple:
+    """Analyse the lines of CHAT_FILE that start in byte range [start, end).
+
+    Returns (user_stats, ts_counts, word_freq, emoji_freq, media_per_day,
+    created, renames) for this chunk only; everything is picklable so pool
+    workers can hand it back to be merged in chunk order.
+    """
+    user_stats: dict[str, UserStats] = {}
+    ts_counts = Counter()
+    word_freq = Counter()
+    emoji_freq = Counter()
+    media_per_day = Counter()
+    created: dict[str, str] | None = None
+    renames: list[tuple[str, str, str, str]] = []
+
+    for raw_line in iter_lines(CHAT_FILE, start, end):
+        # Lines are decoded only once they look like a message
+        if b" - " not in raw_line:
+            continue
+        raw = raw_line.decode("utf-8", "replace").rstrip("\r\n")
 
-    ts_part, content = raw.split(" - ", 1)
-    dt = parse_timestamp(ts_part)
-    if dt is None:
-        continue
-    date_label, weekday_idx, month_num = format_jalali_date(dt)
-    hour_counts[dt.hour] += 1
-    weekday_counts[weekday_idx] += 1
-    month_counts[month_num] += 1
-    messages_per_day[date_label] += 1
-
-    # ===== User message ======================================================
-    if ":" in content:
-        sender, message = content.split(":", 1)
-        sender = sender.strip()
-        message = message.strip()
-        if not sender:
+        idx = raw.find(" - ")
+        if idx == -1:
+            continue
+        ts_part = raw[:idx]
+        content = raw[idx + 3:]
+        dt = parse_timestamp(ts_part)
+        if dt is None:
+            continue
+        ts_counts[dt] += 1
+
+        # ===== User message ==================================================
+        ci = content.find(":")
+        if ci != -1:
+            sender = content[:ci].strip()
+            message = content[ci + 1:].strip()
+            if not sender:
+                continue
+
+            s = user_stats.get(sender)
+            if s is None:
+                s = user_stats[sender] = UserStats(dt)
+
+            s.messages += 1
+            s.char_sum += len(message)
+            # str.split() beats regex counting here and, unlike count(" "), handles runs of whitespace
+            s.word_sum += len(message.split())
+            s.last_ts = dt  # always newest
+
+            if MEDIA_TAG in message:
+                s.media += 1
+                media_per_day[dt.date()] += 1
+            if DELETED_TAG in message:  # exports always use this exact casing
+                s.deleted += 1
+            if has_bad_word(message):
+                s.bad_word += 1
+
+            # Word frequency (basic split, remove punctuation)
+            words = TOKEN_RE.findall(message.lower())
+            if stop_words:
+                words = [w for w in words if w not in stop_words]
+            word_freq.update(words)
+
+            # Emoji detection
+            emoji_freq.update(EMOJI_RE.findall(message))
+            continue
+
+        # ===== System message ================================================
+        # Cheap substring checks first; the regexes only run on likely candidates
+        lowered = content.lower()
+        m = RE_CREATED.match(content) if " created " in lowered else None
+        if m:
+            created = {
+                "created_ts": format_jalali_date(dt)[0],
+                "created_by": m.group(1).strip(),
+                "created_name": m.group(2).strip() or "(unnamed)",
+            }
+            continue
+
+        m = RE_GROUP_RENAME.match(raw) if " changed the group name from " in lowered else None
+        if m:
+            ts_raw, changer, old_name, new_name = m.groups()
+            dt_rename = parse_timestamp(ts_raw.strip())
+            if dt_rename:
+                rename_label, _, _ = format_jalali_date(dt_rename)
+                renames.append((rename_label, changer.strip(), old_name.strip(), new_name.strip()))
             continue
 
-        s = user_stats[sender]
-        s["messages"] += 1
-        s["char_sum"] += len(message)
-        s["word_sum"] += len(message.split())
-        s["first_ts"] = s["first_ts"] or dt
-        s["last_ts"] = dt  # always newest
-
-        if MEDIA_TAG in message:
-            s["media"] += 1
-            media_per_day[date_label] += 1
-        if DELETED_TAG.lower() in message.lower():
-            s["deleted"] += 1
-        if bad_words and any(bw in message for bw in bad_words):
-            s["bad_word"] += 1
-
-        # Word frequency (basic split, remove punctuation)
-        clean = re.sub(r"[\W_]+", " ", message).lower()
-        words = [w for w in clean.split() if w and w not in stop_words]
-        word_freq_global.update(words)
-
-        # Emoji detection
-        if emoji:
-            emoji_list = [ch for ch in message if ch in emoji.EMOJI_DATA]
-        else:
-            emoji_list = EMOJI_PATTERN.findall(message)
-        emoji_freq_global.update(emoji_list)
-        continue
-
-    # ===== System message ====================================================
-    m = RE_CREATED.match(content)
-    if m:
-        group_info.update({
-            "created_ts": date_label,
-            "created_by": m.group(1).strip(),
-            "created_name": m.group(2).strip() or "(unnamed)",
-        })
-        continue
-
-    m = RE_GROUP_RENAME.match(raw)
-    if m:
-        ts_raw, changer, old_name, new_name = m.groups()
-        dt_rename = parse_timestamp(ts_raw.strip())
-        if dt_rename:
-            rename_label, _, _ = format_jalali_date(dt_rename)
-            group_renames.append((rename_label, changer.strip(), old_name.strip(), new_name.strip()))
-        continue
-
-# ---------- Reporting --------------------------------------------------------
-print("\n" + "═" * 100)
-print("USER SUMMARY (sorted by messages)\n")
-print(f"{'Name':<22} | {'Msgs':>6} | {'Media':>5} | {'Del':>4} | {'Bad':>4} | {'AvgChars':>8} | {'AvgWords':>8}")
-print("─" * 100)
-for user, d in sorted(user_stats.items(), key=lambda x: x[1]["messages"], reverse=True):
-    avg_c = d["char_sum"] / d["messages"] if d["messages"] else 0
-    avg_w = d["word_sum"] / d["messages"] if d["messages"] else 0
-    print(f"{user[:22]:<22} | {d['messages']:>6} | {d['media']:>5} | {d['deleted']:>4} | {d['bad_word']:>4} | {avg_c:>8.1f} | {avg_w:>8.1f}")
-print("═" * 100)
-
-# Group creation
-if group_info["created_ts"]:
-    print(f"Group created : {group_info['created_ts']}  by {group_info['created_by']}  (name: {group_info['created_name']})")
-
-# Rename history
-print("\nGroup Rename History:")
-if group_renames:
-    for label, changer, old, new in group_renames:
-        print(f"🕒 {label} | 👤 {changer} renamed → “{old}” → “{new}”")
-else:
-    print("No renames detected.")
-
-# Daily stats
-total_msgs = sum(hour_counts.values())
-if total_msgs:
-    most_media_day, most_media_cnt = max(media_per_day.items(), key=lambda x: x[1]) if media_per_day else ("-", 0)
-    max_day, max_count = max(messages_per_day.items(), key=lambda x: x[1])
-    min_day, min_count = min(messages_per_day.items(), key=lambda x: x[1])
-    avg_per_day = total_msgs / len(messages_per_day)
-    print("\nOverall Message Stats:")
-    print(f"Total messages : {total_msgs}")
-    print(f"Day with most media : {most_media_day} ({most_media_cnt} files sent)")
-    print(f"Most active day : {max_day} ({max_count} messages)")
-    print(f"Least active day: {min_day} ({min_count} messages)")
-    print(f"Average messages per day : {avg_per_day:.2f}")
-
-# Hourly activity
-print("\nHourly Distribution (0‑23):")
-for h in range(24):
-    print(f"{h:02d}: {hour_counts[h]}", end="  " if h % 6 != 5 else "\n")
-
-# Weekday activity
-print("\nWeekday Distribution:")
-for i in range(7):
-    name = FA_WEEKDAYS[i] if jdatetime else ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"][(i+1)%7]
-    print(f"{name:<9}: {weekday_counts[i]}")
-
-# Month activity
-print("\nMonthly Distribution:")
-for m in range(1, 13):
-    print(f"{m:02d}: {month_counts[m]}")
-
-# Top words
-print("\nTop 20 words (ex stop words):")
-for word, cnt in word_freq_global.most_common(20):
-    print(f"{word:<10} {cnt}")
-
-# Emoji stats
-if emoji_freq_global:
-    print("\nTop 20 emojis:")
-    for e, cnt in emoji_freq_global.most_common(20):
-        print(f"{e} {cnt}")
-print("═" * 100)
+    return user_stats, ts_counts, word_freq, emoji_freq, media_per_day, created, renames
+
+def detect_format() -> None:
+    """Settle the timestamp format from the first parsable line, before any chunking."""
+    for raw_line in iter_lines(CHAT_FILE):
+        idx = raw_line.find(b" - ")
+        if idx != -1 and parse_timestamp(raw_line[:idx].decode("utf-8", "replace")):
+            return
+
+def _init_worker(fmt: str | None) -> None:
+    # Every chunk must read ambiguous D/M vs M/D stamps the same way the whole file would
+    global _detected_fmt, _fast_parser
+    if fmt is not None:
+        _detected_fmt = fmt
+        _fast_parser = _FAST_PARSERS[fmt]
+
+def analyse_chat() -> list[tuple]:
+    """Run process_chunk over the chat, across worker processes for large exports."""
+    workers = os.cpu_count() or 1
+    if workers < 2 or CHAT_FILE.stat().st_size < PARALLEL_MIN_BYTES:
+        return [process_chunk()]
+    detect_format()
+    starts, ends = zip(*chunk_offsets(CHAT_FILE, workers))
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(_detected_fmt,)) as ex:
+        return list(ex.map(process_chunk, starts, ends))
+
+if __name__ == "__main__":
+    # ---------- Merged results ---------------------------------------------------
+    user_stats: dict[str, UserStats] = {}
+
+    hour_counts = [0] * 24      # 0‑23
+    weekday_counts = [0] * 7    # 0‑6 (Sat=0)
+    month_counts = [0] * 13     # 1‑12 (Jalali or Gregorian), index 0 unused
+    ts_counts = Counter()       # datetime -> messages, expanded into the above below
+
+    word_freq_global = Counter()
+    emoji_freq_global = Counter()
+    # Keyed by Gregorian date; labels are formatted only for the days that get reported
+    media_per_day = Counter()
+    messages_per_day = Counter()
+
+    group_info: dict[str, str | None] = {"created_ts": None, "created_by": None, "created_name": None}
+    group_renames: list[tuple[str, str, str, str]] = []  # (date, changer, old, new)
+
+    # ---------- Merge chunks -----------------------------------------------------
+    # Chunks come back in file order, so first-seen ordering (used to break ties
+    # in the report) matches a single sequential pass.
+    for chunk_users, chunk_ts, chunk_words, chunk_emojis, chunk_media, created, renames in analyse_chat():
+        for sender, cs in chunk_users.items():
+            s = user_stats.get(sender)
+            if s is None:
+                user_stats[sender] = cs
+            else:
+                s.merge(cs)
+        ts_counts.update(chunk_ts)
+        word_freq_global.update(chunk_words)
+        emoji_freq_global.update(chunk_emojis)
+        media_per_day.update(chunk_media)
+        if created:
+            group_info.update(created)
+        group_renames.extend(renames)
+
+    # ---------- Time aggregation -------------------------------------------------
+    # Busy chats repeat the same minute stamp many times, so bump the time
+    # distributions once per stamp instead of once per message.
+    for dt, n in ts_counts.items():
+        hour_counts[dt.hour] += n
+        messages_per_day[dt.date()] += n
+
+    # Jalali conversion then runs once per calendar day
+    for day, n in messages_per_day.items():
+        _, weekday_idx, month_num = jalali_day(day)
+        weekday_counts[weekday_idx] += n
+        month_counts[month_num] += n
+
+    # ---------- Reporting --------------------------------------------------------
+    print("\n" + "═" * 100)
+    print("USER SUMMARY (sorted by messages)\n")
+    print(f"{'Name':<22} | {'Msgs':>6} | {'Media':>5} | {'Del':>4} | {'Bad':>4} | {'AvgChars':>8} | {'AvgWords':>8}")
+    print("─" * 100)
+    rows = [(user, d.messages, d.media, d.deleted, d.bad_word, d.char_sum, d.word_sum) for user, d in user_stats.items()]
+    rows.sort(key=itemgetter(1), reverse=True)
+    for user, msgs, media, deleted, bad, char_sum, word_sum in rows:
+        avg_c = char_sum / msgs if msgs else 0
+        avg_w = word_sum / msgs if msgs else 0
+        print(f"{user[:22]:<22} | {msgs:>6} | {media:>5} | {deleted:>4} | {bad:>4} | {avg_c:>8.1f} | {avg_w:>8.1f}")
+    print("═" * 100)
+
+    # Group creation
+    if group_info["created_ts"]:
+        print(f"Group created : {group_info['created_ts']}  by {group_info['created_by']}  (name: {group_info['created_name']})")
+
+    # Rename history
+    print("\nGroup Rename History:")
+    if group_renames:
+        for label, changer, old, new in group_renames:
+            print(f"🕒 {label} | 👤 {changer} renamed → “{old}” → “{new}”")
+    else:
+        print("No renames detected.")
+
+    # Daily stats
+    total_msgs = sum(hour_counts)
+    if total_msgs:
+        most_media_day, most_media_cnt = max(media_per_day.items(), key=lambda x: x[1]) if media_per_day else (None, 0)
+        max_day, max_count = max(messages_per_day.items(), key=lambda x: x[1])
+        min_day, min_count = min(messages_per_day.items(), key=lambda x: x[1])
+        most_media_day = jalali_day(most_media_day)[0] if most_media_day else "-"
+        max_day = jalali_day(max_day)[0]
+        min_day = jalali_day(min_day)[0]
+        avg_per_day = total_msgs / len(messages_per_day)
+        print("\nOverall Message Stats:")
+        print(f"Total messages : {total_msgs}")
+        print(f"Day with most media : {most_media_day} ({most_media_cnt} files sent)")
+        print(f"Most active day : {max_day} ({max_count} messages)")
+        print(f"Least active day: {min_day} ({min_count} messages)")
+        print(f"Average messages per day : {avg_per_day:.2f}")
+
+    # Hourly activity
+    print("\nHourly Distribution (0‑23):")
+    for h in range(24):
+        print(f"{h:02d}: {hour_counts[h]}", end="  " if h % 6 != 5 else "\n")
+
+    # Weekday activity
+    print("\nWeekday Distribution:")
+    for i in range(7):
+        name = FA_WEEKDAYS[i] if jdatetime else ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"][(i+1)%7]
+        print(f"{name:<9}: {weekday_counts[i]}")
+
+    # Month activity
+    print("\nMonthly Distribution:")
+    for m in range(1, 13):
+        print(f"{m:02d}: {month_counts[m]}")
+
+    # Top words
+    print("\nTop 20 words (ex stop words):")
+    for word, cnt in heapq.nlargest(20, word_freq_global.items(), key=itemgetter(1)):
+        print(f"{word:<10} {cnt}")
+
+    # Emoji stats
+    if emoji_freq_global:
+        print("\nTop 20 emojis:")
+        for e, cnt in heapq.nlargest(20, emoji_freq_global.items(), key=itemgetter(1)):
+            print(f"{e} {cnt}")
+    print("═" * 100)